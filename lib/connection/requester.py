@@ -31,11 +31,12 @@ from urllib.parse import urlparse
 
 import httpx
 import requests
+from requests.adapters import DEFAULT_POOLSIZE
 from requests.auth import AuthBase, HTTPBasicAuth, HTTPDigestAuth
 from requests.packages import urllib3
 from requests_ntlm import HttpNtlmAuth
 from httpx_ntlm import HttpNtlmAuth as HttpxNtlmAuth
-from requests_toolbelt.adapters.socket_options import SocketOptionsAdapter
+from requests_toolbelt.adapters import socket_options
 
 from lib.connection.dns import cached_getaddrinfo
 from lib.connection.response import AsyncResponse, Response
@@ -135,6 +136,11 @@ class BaseRequester:
         return self._rate
 
 
+class SocketOptionsAdapter(socket_options.SocketOptionsAdapter):
+    # Keep the socket options when the session is pickled into a session file
+    __attrs__ = socket_options.SocketOptionsAdapter.__attrs__ + ["socket_options"]
+
+
 class HTTPBearerAuth(AuthBase):
     def __init__(self, token: str) -> None:
         self.token = token
@@ -152,15 +158,17 @@ class Requester(BaseRequester):
         self.session.verify = False
         self.session.cert = self._cert
 
+        # One adapter (one pool manager) for both schemes, with room for a
+        # host pool per target so multi-target runs don't evict each other
+        adapter = SocketOptionsAdapter(
+            max_retries=0,
+            pool_connections=max(len(options["urls"]), DEFAULT_POOLSIZE),
+            pool_maxsize=options["thread_count"],
+            socket_options=self._socket_options,
+        )
+
         for scheme in ("http://", "https://"):
-            self.session.mount(
-                scheme,
-                SocketOptionsAdapter(
-                    max_retries=0,
-                    pool_maxsize=options["thread_count"],
-                    socket_options=self._socket_options,
-                ),
-            )
+            self.session.mount(scheme, adapter)
 
     def set_auth(self, type: str, credential: str) -> None:
         if type in ("bearer", "jwt"):
@@ -221,7 +229,13 @@ class Requester(BaseRequester):
                     timeout=options["timeout"],
                     stream=True,
                 )
-                response = Response(origin_response)
+
+                try:
+                    response = Response(origin_response)
+                finally:
+                    # Responses that stop reading early (binary data, size cap) would
+                    # hold their pool slot and socket until garbage collected
+                    origin_response.close()
 
                 log_msg = f'"{options["http_method"]} {response.url}" {response.status} - {response.length}B'
 
@@ -80,15 +80,26 @@ class Response(BaseResponse):
     def __init__(self, response: requests.Response) -> None:
         super().__init__(response)
 
+        binary = False
+        # Join the chunks once at the end, growing the body with += copies
+        # everything read so far for every new chunk
+        chunks = []
+        size = 0
+
         for chunk in response.iter_content(chunk_size=ITER_CHUNK_SIZE):
-            self.body += chunk
+            chunks.append(chunk)
+            size += len(chunk)
+            # Only the new chunk needs checking, the previous ones were checked already
+            binary = binary or is_binary(chunk)
 
-            if len(self.body) >= MAX_RESPONSE_SIZE or (
-                "content-length" in self.headers and is_binary(self.body)
+            if size >= MAX_RESPONSE_SIZE or (
+                "content-length" in self.headers and binary
             ):
                 break
 
-        if not is_binary(self.body):
+        self.body = b"".join(chunks)
+
+        if not binary:
             try:
                 self.content = self.body.decode(
                     response.encoding or DEFAULT_ENCODING, errors="ignore"
@@ -101,15 +112,26 @@ class AsyncResponse(BaseResponse):
     @classmethod
     async def create(cls, response: httpx.Response) -> AsyncResponse:
         self = cls(response)
+        binary = False
+        # Join the chunks once at the end, growing the body with += copies
+        # everything read so far for every new chunk
+        chunks = []
+        size = 0
+
         async for chunk in response.aiter_bytes(chunk_size=ITER_CHUNK_SIZE):
-            self.body += chunk
+            chunks.append(chunk)
+            size += len(chunk)
+            # Only the new chunk needs checking, the previous ones were checked already
+            binary = binary or is_binary(chunk)
 
-            if len(self.body) >= MAX_RESPONSE_SIZE or (
-                "content-length" in self.headers and is_binary(self.body)
+            if size >= MAX_RESPONSE_SIZE or (
+                "content-length" in self.headers and binary
             ):
                 break
 
-        if not is_binary(self.body):
+        self.body = b"".join(chunks)
+
+        if not binary:
             try:
                 self.content = self.body.decode(
                     response.encoding or DEFAULT_ENCODING, errors="ignore"
@@ -19,7 +19,6 @@
 from __future__ import annotations
 
 import asyncio
-import gc
 import os
 import signal
 import psycopg
@@ -27,6 +26,8 @@ import re
 import time
 import mysql.connector
 
+from collections import deque
+from itertools import islice
 from urllib.parse import urlparse
 
 from lib.connection.dns import cache_dns
@@ -109,6 +110,8 @@ class Controller:
 
         # Can't pickle Fuzzer class due to _thread.lock objects
         del self.fuzzer
+        # Write buffered results before the session is saved
+        self.reporter.flush()
 
         with open(session_file, "wb") as fd:
             pickle((vars(self), last_output, options), fd)
@@ -140,7 +143,7 @@ class Controller:
         self.dictionary = Dictionary(files=options["wordlists"])
         self.start_time = time.time()
         self.passed_urls: set[str] = set()
-        self.directories: list[str] = []
+        self.directories: deque[str] = deque()
         self.jobs_processed = 0
         self.errors = 0
         self.consecutive_errors = 0
@@ -200,50 +203,55 @@ class Controller:
         )
         error_callbacks = (self.raise_error, self.append_error_log)
 
-        while options["urls"]:
-            url = options["urls"][0]
-            self.fuzzer = Fuzzer(
-                self.requester,
-                self.dictionary,
-                match_callbacks=match_callbacks,
-                not_found_callbacks=not_found_callbacks,
-                error_callbacks=error_callbacks,
-            )
-
-            try:
-                self.set_target(url)
-
-                if not self.directories:
-                    for subdir in options["subdirs"]:
-                        self.add_directory(self.base_path + subdir)
-
-                if not self.old_session:
-                    interface.target(self.url)
-
-                self.reporter.prepare(self.url)
-                self.start()
-
-            except (
-                CannotConnectException,
-                FileExistsException,
-                InvalidURLException,
-                RequestException,
-                SkipTargetInterrupt,
-                KeyboardInterrupt,
-            ) as e:
-                self.directories.clear()
-                self.dictionary.reset()
-
-                if e.args:
-                    interface.error(str(e))
-
-            except QuitInterrupt as e:
-                self.reporter.finish()
-                interface.error(e.args[0])
-                exit(0)
+        try:
+            while options["urls"]:
+                url = options["urls"][0]
+                self.fuzzer = Fuzzer(
+                    self.requester,
+                    self.dictionary,
+                    match_callbacks=match_callbacks,
+                    not_found_callbacks=not_found_callbacks,
+                    error_callbacks=error_callbacks,
+                )
 
-            finally:
-                options["urls"].pop(0)
+                try:
+                    self.set_target(url)
+
+                    if not self.directories:
+                        for subdir in options["subdirs"]:
+                            self.add_directory(self.base_path + subdir)
+
+                    if not self.old_session:
+                        interface.target(self.url)
+
+                    self.reporter.prepare(self.url)
+                    self.start()
+
+                except (
+                    CannotConnectException,
+                    FileExistsException,
+                    InvalidURLException,
+                    RequestException,
+                    SkipTargetInterrupt,
+                    KeyboardInterrupt,
+                ) as e:
+                    self.directories.clear()
+                    self.dictionary.reset()
+
+                    if e.args:
+                        interface.error(str(e))
+
+                except QuitInterrupt as e:
+                    self.reporter.finish()
+                    interface.error(e.args[0])
+                    exit(0)
+
+                finally:
+                    options["urls"].pop(0)
+        finally:
+            # Results are buffered by the reporter, write them even when
+            # the run is aborted by an unhandled error
+            self.reporter.flush()
 
         interface.warning("\nTask Completed")
         self.reporter.finish()
@@ -257,8 +265,6 @@ class Controller:
     def start(self) -> None:
         while self.directories:
             try:
-                gc.collect()
-
                 current_directory = self.directories[0]
 
                 if not self.old_session:
@@ -282,7 +288,7 @@ class Controller:
 
             finally:
                 self.dictionary.reset()
-                self.directories.pop(0)
+                self.directories.popleft()
 
                 self.jobs_processed += 1
                 self.old_session = False
@@ -504,7 +510,9 @@ class Controller:
     def process(self) -> None:
         while True:
             try:
-                while not self.fuzzer.is_finished():
+                # Sleep in join() instead of spinning, but wake up regularly
+                # to check the runtime limit and errors from the threads
+                while not self.fuzzer.wait(0.3):
                     if self.is_timed_out():
                         raise SkipTargetInterrupt(
                             "Runtime exceeded the maximum set by the user"
@@ -520,18 +528,23 @@ class Controller:
     def add_directory(self, path: str) -> None:
         """Add directory to the recursion queue"""
 
+        url = self.url + path
+
+        # Cheap set lookup first, deep recursion keeps re-adding the same parents
+        if url in self.passed_urls:
+            return
+
+        exclude_subdirs = options["exclude_subdirs"]
         # Pass if path is in exclusive directories
-        if any(
-            path.startswith(dir) or "/" + dir in path
-            for dir in options["exclude_subdirs"]
+        if path.startswith(exclude_subdirs) or any(
+            "/" + dir in path for dir in exclude_subdirs
         ):
             return
 
-        url = self.url + path
-
+        # Only count the path depth when there is a maximum recursion depth
         if (
-            path.count("/") - self.base_path.count("/") > options["recursion_depth"] > 0
-            or url in self.passed_urls
+            options["recursion_depth"] > 0
+            and path.count("/") - self.base_path.count("/") > options["recursion_depth"]
         ):
             return
 
@@ -558,8 +571,10 @@ class Controller:
         ):
             self.add_directory(path)
 
-        # Return newly added directories
-        return self.directories[dirs_count:]
+        # Return newly added directories, only walk the tail of the queue
+        return list(
+            islice(reversed(self.directories), len(self.directories) - dirs_count)
+        )[::-1]
 
     def recur_for_redirect(self, path: str, redirect_path: str) -> list[str]:
         if redirect_path == path + "/":
@@ -20,8 +20,7 @@ from __future__ import annotations
 
 from typing import Any
 
-# we can't import `Dictionary` due to a circular import
-blacklists: dict[int, Any] = {}
+blacklists: dict[int, tuple[str, ...]] = {}
 options: dict[str, Any] = {
     "urls": [],
     "urls_file": None,
@@ -48,7 +47,7 @@ options: dict[str, Any] = {
     "recursion_depth": 0,
     "recursion_status_codes": set(),
     "subdirs": [],
-    "exclude_subdirs": [],
+    "exclude_subdirs": (),
     "include_status_codes": set(),
     "exclude_status_codes": set(),
     "exclude_sizes": set(),
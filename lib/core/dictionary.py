@@ -19,6 +19,8 @@
 from __future__ import annotations
 
 import re
+from array import array
+from itertools import accumulate
 from typing import Any, Iterator
 
 from lib.core.data import options
@@ -37,22 +39,22 @@ from lib.utils.file import FileUtils
 
 # Get ignore paths for status codes.
 # Reference: https://github.com/maurosoria/dirsearch#Blacklist
-def get_blacklists() -> dict[int, Dictionary]:
+def get_blacklists() -> dict[int, tuple[str, ...]]:
     blacklists = {}
+    db_path = FileUtils.build_path(SCRIPT_PATH, "db")
 
     for status in [400, 403, 500]:
-        blacklist_file_name = FileUtils.build_path(SCRIPT_PATH, "db")
-        blacklist_file_name = FileUtils.build_path(
-            blacklist_file_name, f"{status}_blacklist.txt"
-        )
+        blacklist_file_name = FileUtils.build_path(db_path, f"{status}_blacklist.txt")
 
         if not FileUtils.can_read(blacklist_file_name):
             # Skip if cannot read file
             continue
 
-        blacklists[status] = Dictionary(
-            files=[blacklist_file_name],
-            is_blacklist=True,
+        # Keep the paths as a tuple of suffixes, so a response can be
+        # checked against the whole blacklist with one str.endswith() call
+        blacklists[status] = tuple(
+            lstrip_once(path, "/")
+            for path in Dictionary(files=[blacklist_file_name], is_blacklist=True)
         )
 
     return blacklists
@@ -61,7 +63,7 @@ def get_blacklists() -> dict[int, Dictionary]:
 class Dictionary:
     def __init__(self, **kwargs: Any) -> None:
         self._index = 0
-        self._items = self.generate(**kwargs)
+        self._set_items(self.generate(**kwargs))
 
     @property
     def index(self) -> int:
@@ -69,29 +71,39 @@ class Dictionary:
 
     @locked
     def __next__(self) -> str:
-        try:
-            path = self._items[self._index]
-        except IndexError:
+        if self._index >= len(self):
             raise StopIteration
 
+        path = self._get(self._index)
         self._index += 1
 
         return path
 
     def __contains__(self, item: str) -> bool:
-        return item in self._items
+        return item in iter(self)
 
     def __getstate__(self) -> tuple[list[str], int]:
-        return self._items, self._index
+        return list(self), self._index
 
     def __setstate__(self, state: tuple[list[str], int]) -> None:
-        self._items, self._index = state
+        items, self._index = state
+        self._set_items(items)
 
     def __iter__(self) -> Iterator[str]:
-        return iter(self._items)
+        return map(self._get, range(len(self)))
 
     def __len__(self) -> int:
-        return len(self._items)
+        return len(self._offsets) - 1
+
+    def _set_items(self, items: list[str]) -> None:
+        # Big wordlists hold millions of short paths, a str object per path
+        # costs ~50 bytes of overhead. Keep them concatenated in a single
+        # string instead, with the offset of each path in an array
+        self._data = "".join(items)
+        self._offsets = array("Q", accumulate(map(len, items), initial=0))
+
+    def _get(self, index: int) -> str:
+        return self._data[self._offsets[index]:self._offsets[index + 1]]
 
     def generate(self, files: list[str] = [], is_blacklist: bool = False) -> list[str]:
         """
@@ -37,7 +37,7 @@ from lib.core.settings import (
     WILDCARD_TEST_POINT_MARKER,
 )
 from lib.parse.url import clean_path
-from lib.utils.common import get_readable_size, lstrip_once
+from lib.utils.common import get_readable_size
 from lib.utils.crawl import Crawler
 
 
@@ -59,6 +59,19 @@ class BaseFuzzer:
         self.match_callbacks = match_callbacks
         self.not_found_callbacks = not_found_callbacks
         self.error_callbacks = error_callbacks
+        self._exclude_regex = (
+            re.compile(options["exclude_regex"]) if options["exclude_regex"] else None
+        )
+        self._exclude_redirect_regex = None
+
+        if redirect := options["exclude_redirect"]:
+            # The filter matches either as a regex or as a plain substring,
+            # combine both so a single search() covers them
+            try:
+                self._exclude_redirect_regex = re.compile(f"{redirect}|{re.escape(redirect)}")
+            except re.error:
+                # Not a regular expression, only match it as a substring
+                self._exclude_redirect_regex = re.compile(re.escape(redirect))
 
         self.scanners: dict[str, dict[str, Scanner]] = {
             "default": {},
@@ -84,8 +97,7 @@ class BaseFuzzer:
         for scanner in self.scanners["default"].values():
             yield scanner
 
-    @staticmethod
-    def is_excluded(resp: BaseResponse) -> bool:
+    def is_excluded(self, resp: BaseResponse) -> bool:
         """Validate the response by different filters"""
 
         if resp.status in options["exclude_status_codes"]:
@@ -97,36 +109,36 @@ class BaseFuzzer:
         ):
             return True
 
-        if (
-            resp.status in blacklists
-            and any(
-                resp.path.endswith(lstrip_once(suffix, "/"))
-                for suffix in blacklists.get(resp.status)
-            )
-        ):
+        blacklist = blacklists.get(resp.status)
+        if blacklist and resp.path.endswith(blacklist):
             return True
 
-        if get_readable_size(resp.length).rstrip() in options["exclude_sizes"]:
+        # Computed from the headers on each access, only do it once
+        length = resp.length
+
+        if (
+            options["exclude_sizes"]
+            and get_readable_size(length).rstrip() in options["exclude_sizes"]
+        ):
             return True
 
-        if resp.length < options["minimum_response_size"]:
+        if length < options["minimum_response_size"]:
             return True
 
-        if resp.length > options["maximum_response_size"] > 0:
+        if length > options["maximum_response_size"] > 0:
             return True
 
-        if any(text in resp.content for text in options["exclude_texts"]):
+        if options["exclude_texts"] and any(
+            text in resp.content for text in options["exclude_texts"]
+        ):
             return True
 
-        if options["exclude_regex"] and re.search(options["exclude_regex"], resp.content):
+        if self._exclude_regex and self._exclude_regex.search(resp.content):
             return True
 
         if (
-            options["exclude_redirect"]
-            and (
-                options["exclude_redirect"] in resp.redirect
-                or re.search(options["exclude_redirect"], resp.redirect)
-            )
+            self._exclude_redirect_regex
+            and self._exclude_redirect_regex.search(resp.redirect)
         ):
             return True
 
@@ -213,14 +225,25 @@ class Fuzzer(BaseFuzzer):
         for thread in self._threads:
             thread.start()
 
-    def is_finished(self) -> bool:
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Block until all threads are finished or the timeout expires,
+        return True if they are finished
+        """
+
         if self.exc:
             raise self.exc
 
         for thread in self._threads:
+            thread.join(timeout)
+
             if thread.is_alive():
                 return False
 
+        # Errors from the callbacks while joining
+        if self.exc:
+            raise self.exc
+
         return True
 
     def play(self) -> None:
@@ -16,10 +16,15 @@
 #
 #  Author: Mauro Soria
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from queue import SimpleQueue
+from typing import TextIO
 
 from lib.core.data import options
+from lib.core.settings import LOG_BUFFER_SIZE, LOG_FLUSH_DELAY
 
 
 logger = logging.getLogger(__name__)
@@ -27,10 +32,53 @@ logger.setLevel(logging.DEBUG)
 logger.disabled = True
 
 
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that writes through a large buffer, flushed periodically
+    by a background thread instead of after every record
+    """
+
+    def __init__(self, filename: str) -> None:
+        super().__init__(filename)
+        self._closed = threading.Event()
+        threading.Thread(target=self._flush_periodically, daemon=True).start()
+
+    def _open(self) -> TextIO:
+        return open(
+            self.baseFilename, self.mode, buffering=LOG_BUFFER_SIZE, encoding=self.encoding
+        )
+
+    def flush(self) -> None:
+        # Called after every record, the buffer is flushed by the thread
+        # and when the handler is closed
+        pass
+
+    def close(self) -> None:
+        self._closed.set()
+        super().close()
+
+    def _flush_periodically(self) -> None:
+        while not self._closed.wait(LOG_FLUSH_DELAY):
+            super().flush()
+
+
 def enable_logging() -> None:
     logger.disabled = False
     formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(message)s')
-    handler = RotatingFileHandler(options["log_file"], maxBytes=options["log_file_size"])
+
+    if options["log_file_size"]:
+        handler = RotatingFileHandler(options["log_file"], maxBytes=options["log_file_size"])
+    else:
+        # Without a size limit there is nothing to roll over
+        handler = BufferedFileHandler(options["log_file"])
+
     handler.setLevel(logging.DEBUG)
     handler.setFormatter(formatter)
-    logger.addHandler(handler)
+
+    # Threads only enqueue their records, a single listener thread writes
+    # them so they don't contend for the file handler during error storms
+    queue = SimpleQueue()
+    listener = QueueListener(queue, handler)
+    listener.start()
+    atexit.register(listener.stop)
+    logger.addHandler(QueueHandler(queue))
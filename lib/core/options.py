@@ -18,6 +18,8 @@
 
 from __future__ import annotations
 
+import re
+
 from optparse import Values
 from typing import Any
 from lib.core.settings import (
@@ -143,7 +145,7 @@ def parse_options() -> dict[str, Any]:
             ]
         )
     ]
-    opt.exclude_subdirs = [
+    opt.exclude_subdirs = tuple(
         subdir.lstrip("/")
         for subdir in strip_and_uniquify(
             [
@@ -151,8 +153,17 @@ def parse_options() -> dict[str, Any]:
                 for subdir in opt.exclude_subdirs.split(",")
             ]
         )
-    ]
-    opt.exclude_sizes = {size.strip().upper() for size in opt.exclude_sizes.split(",")}
+    )
+    opt.exclude_sizes = {
+        size.strip().upper() for size in opt.exclude_sizes.split(",") if size.strip()
+    }
+
+    if opt.exclude_regex:
+        try:
+            re.compile(opt.exclude_regex)
+        except re.error:
+            print(f"Invalid regular expression: {opt.exclude_regex}")
+            exit(1)
 
     if opt.remove_extensions:
         opt.extensions = ("",)
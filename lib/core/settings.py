@@ -115,6 +115,12 @@ SOCKET_TIMEOUT = 6
 
 RATE_UPDATE_DELAY = 0.15
 
+REPORT_FLUSH_DELAY = 2
+
+LOG_FLUSH_DELAY = 1
+
+LOG_BUFFER_SIZE = 64 * 1024
+
 MAX_MATCH_RATIO = 0.98
 
 ITER_CHUNK_SIZE = 1024 * 1024
@@ -29,6 +29,10 @@ def clean_path(path: str, keep_queries: bool = False, keep_fragment: bool = Fals
 
 
 def parse_path(value: str) -> str:
+    # Relative URLs (e.g. most redirects) have no scheme or host to strip
+    if "//" not in value:
+        return lstrip_once(value, "/")
+
     try:
         scheme, url = value.split("//", 1)
         if (
@@ -39,9 +39,10 @@ class CSVReport(FileReportMixin, BaseReport):
             return rows
 
     @locked
-    def save(self, file, result):
+    def save(self, file, results):
         rows = self.parse(file)
-        rows.append([result.url, result.status, result.length, result.type, result.redirect])
+        for result in results:
+            rows.append([result.url, result.status, result.length, result.type, result.redirect])
         self.write(file, rows)
 
     def write(self, file, rows):
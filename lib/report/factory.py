@@ -29,7 +29,7 @@ class BaseReport(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def save(self, result):
+    def save(self, results):
         raise NotImplementedError
 
 
@@ -106,23 +106,24 @@ class SQLReportMixin:
             conn.close()
 
     @locked
-    def save(self, database, table, result):
+    def save(self, database, table, results):
         conn = self.get_connection(database)
         cursor = conn.cursor()
 
-        cursor.execute(
-            *self.get_insert_table_query(
-                table,
-                (
-                    result.datetime,
-                    result.url,
-                    result.status,
-                    result.length,
-                    result.type,
-                    result.redirect,
-                ),
+        for result in results:
+            cursor.execute(
+                *self.get_insert_table_query(
+                    table,
+                    (
+                        result.datetime,
+                        result.url,
+                        result.status,
+                        result.length,
+                        result.type,
+                        result.redirect,
+                    ),
+                )
             )
-        )
         conn.commit()
 
         if not self._reuse:
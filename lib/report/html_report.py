@@ -42,16 +42,17 @@ class HTMLReport(FileReportMixin, BaseReport):
                     return json.loads(line[19:-2])
 
     @locked
-    def save(self, file, result):
-        results = self.parse(file)
-        results.append({
-            "url": result.url,
-            "status": result.status,
-            "contentLength": result.length,
-            "contentType": result.type,
-            "redirect": result.redirect,
-        })
-        self.write(file, self.generate(results))
+    def save(self, file, results):
+        rows = self.parse(file)
+        for result in results:
+            rows.append({
+                "url": result.url,
+                "status": result.status,
+                "contentLength": result.length,
+                "contentType": result.type,
+                "redirect": result.redirect,
+            })
+        self.write(file, self.generate(rows))
 
     def generate(self, results):
         file_loader = FileSystemLoader(
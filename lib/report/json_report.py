@@ -38,15 +38,16 @@ class JSONReport(FileReportMixin, BaseReport):
             return json.load(fh)
 
     @locked
-    def save(self, file, result):
+    def save(self, file, results):
         data = self.parse(file)
-        data["results"].append({
-            "url": result.url,
-            "status": result.status,
-            "contentLength": result.length,
-            "contentType": result.type,
-            "redirect": result.redirect,
-        })
+        for result in results:
+            data["results"].append({
+                "url": result.url,
+                "status": result.status,
+                "contentLength": result.length,
+                "contentType": result.type,
+                "redirect": result.redirect,
+            })
         self.write(file, data)
 
     def write(self, file, data):
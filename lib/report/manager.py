@@ -16,10 +16,13 @@
 #
 #  Author: Mauro Soria
 
+import threading
+
 from urllib.parse import urlparse
 
 from lib.core.data import options
-from lib.core.settings import STANDARD_PORTS, START_DATETIME
+from lib.core.decorators import locked
+from lib.core.settings import REPORT_FLUSH_DELAY, STANDARD_PORTS, START_DATETIME
 from lib.report.csv_report import CSVReport
 from lib.report.html_report import HTMLReport
 from lib.report.json_report import JSONReport
@@ -45,10 +48,17 @@ output_handlers = {
     "postgresql": (PostgreSQLReport, [options["postgres_url"], options["output_table"]]),
 }
 
+_flush_lock = threading.Lock()
+
 
 class ReportManager:
     def __init__(self, formats):
         self.reports = []
+        self.results = []
+        self.initiated = set()
+        # Error from a flush in the timer thread, raised on the next call
+        # from the controller
+        self.exc = None
 
         for format in formats:
             # No output location provided
@@ -57,27 +67,77 @@ class ReportManager:
             self.reports.append((output_handlers[format][0](), output_handlers[format][1]))
 
     def prepare(self, target):
+        # Write what is left from the previous target first
+        self.flush()
+        self.raise_error()
+
         for reporter, sources in self.reports:
-            reporter.initiate(
-                *map(
-                    lambda s: self.format(s, target, reporter),
-                    sources,
-                )
-            )
+            args = tuple(self.format(s, target, reporter) for s in sources)
+            # Targets can share the same output (e.g. no {host} variable), only
+            # set it up once instead of re-validating or recreating it
+            if (type(reporter), args) in self.initiated:
+                continue
+
+            reporter.initiate(*args)
+            self.initiated.add((type(reporter), args))
 
     def save(self, result):
-        for reporter, sources in self.reports:
-            reporter.save(
-                *map(
-                    lambda s: self.format(s, result.url, reporter),
-                    sources,
-                ),
-                result,
-            )
+        # Reports are rewritten as a whole on each save, so results are
+        # buffered and written in batches rather than one by one
+        if self.add_result(result):
+            timer = threading.Timer(REPORT_FLUSH_DELAY, self.flush)
+            timer.daemon = True
+            timer.start()
+
+        # Only after the result is buffered, the working outputs still get it
+        self.raise_error()
+
+    @locked
+    def add_result(self, result):
+        self.results.append(result)
+        # Only the first result of a batch schedules the flush
+        return len(self.results) == 1
+
+    @locked
+    def pop_results(self):
+        results, self.results = self.results, []
+        return results
+
+    def flush(self):
+        with _flush_lock:
+            results = self.pop_results()
+            if not results:
+                return
+
+            for reporter, sources in self.reports:
+                # Results can come from different hosts (e.g. followed redirects)
+                batches = {}
+                for result in results:
+                    batches.setdefault(
+                        tuple(self.format(s, result.url, reporter) for s in sources), []
+                    ).append(result)
+
+                for args, batch in batches.items():
+                    # One failing output mustn't drop the results of the others
+                    try:
+                        reporter.save(*args, batch)
+                    except Exception as e:
+                        self.exc = e
+
+    @locked
+    def raise_error(self):
+        if self.exc:
+            exc, self.exc = self.exc, None
+            raise exc
 
     def finish(self):
-        for reporter, sources in self.reports:
-            reporter.finish()
+        self.flush()
+
+        with _flush_lock:
+            for reporter, sources in self.reports:
+                reporter.finish()
+
+        self.raise_error()
 
     def format(self, string, target, handler):
         parsed = urlparse(target)
@@ -40,7 +40,8 @@ class MarkdownReport(FileReportMixin, BaseReport):
         return header
 
     @locked
-    def save(self, file, result):
+    def save(self, file, results):
         md = self.parse(file)
-        md += f"{result.url} | {result.status} | {result.length} | {result.type} | {result.redirect}" + NEW_LINE
+        for result in results:
+            md += f"{result.url} | {result.status} | {result.length} | {result.type} | {result.redirect}" + NEW_LINE
         self.write(file, md)
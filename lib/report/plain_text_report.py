@@ -34,14 +34,16 @@ class PlainTextReport(FileReportMixin, BaseReport):
         return f"# Dirsearch started {START_TIME} as: {COMMAND}" + NEW_LINE * 2
 
     @locked
-    def save(self, file, result):
-        readable_size = get_readable_size(result.length)
+    def save(self, file, results):
         data = self.parse(file)
-        data += f"{result.status} {readable_size.rjust(6, chr(32))} {result.url}"
 
-        if result.redirect:
-            data += f"  ->  {result.redirect}"
+        for result in results:
+            readable_size = get_readable_size(result.length)
+            data += f"{result.status} {readable_size.rjust(6, chr(32))} {result.url}"
 
-        data += NEW_LINE
+            if result.redirect:
+                data += f"  ->  {result.redirect}"
+
+            data += NEW_LINE
 
         self.write(file, data)
@@ -29,7 +29,8 @@ class SimpleReport(FileReportMixin, BaseReport):
         return ""
 
     @locked
-    def save(self, file, result):
+    def save(self, file, results):
         data = self.parse(file)
-        data += result.url + NEW_LINE
+        for result in results:
+            data += result.url + NEW_LINE
         self.write(file, data)
@@ -38,13 +38,14 @@ class XMLReport(FileReportMixin, BaseReport):
         return ET.parse(file).getroot()
 
     @locked
-    def save(self, file, result):
+    def save(self, file, results):
         root = self.parse(file)
-        target = ET.SubElement(root, "result", url=result.url)
-        ET.SubElement(target, "status").text = str(result.status)
-        ET.SubElement(target, "contentLength").text = str(result.length)
-        ET.SubElement(target, "contentType").text = result.type
-        ET.SubElement(target, "redirect").text = result.redirect
+        for result in results:
+            target = ET.SubElement(root, "result", url=result.url)
+            ET.SubElement(target, "status").text = str(result.status)
+            ET.SubElement(target, "contentLength").text = str(result.length)
+            ET.SubElement(target, "contentType").text = result.type
+            ET.SubElement(target, "redirect").text = result.redirect
         self.write(file, root)
 
     def write(self, file, root):
@@ -25,6 +25,7 @@ from lib.core.exceptions import UnpicklingError
 
 ALLOWED_PICKLE_CLASSES = (
     "collections.OrderedDict",
+    "collections.deque",
     "http.cookiejar.Cookie",
     "http.cookiejar.DefaultCookiePolicy",
     "requests.adapters.HTTPAdapter",
@@ -32,23 +33,22 @@ ALLOWED_PICKLE_CLASSES = (
     "requests.sessions.Session",
     "requests.structures.CaseInsensitiveDict",
     "lib.connection.requester.Requester",
+    "lib.connection.requester.SocketOptionsAdapter",
     "lib.connection.response.Response",
     "lib.connection.requester.Session",
     "lib.core.dictionary.Dictionary",
-    "lib.core.report_manager.Report",
-    "lib.core.report_manager.ReportManager",
-    "lib.core.report_manager.Result",
     "lib.core.structures.AttributeDict",
     "lib.core.structures.CaseInsensitiveDict",
     "lib.output.verbose.Output",
-    "lib.reports.csv_report.CSVReport",
-    "lib.reports.html_report.HTMLReport",
-    "lib.reports.json_report.JSONReport",
-    "lib.reports.markdown_report.MarkdownReport",
-    "lib.reports.plain_text_report.PlainTextReport",
-    "lib.reports.simple_report.SimpleReport",
-    "lib.reports.xml_report.XMLReport",
-    "lib.reports.sqlite_report.SQLiteReport",
+    "lib.report.manager.ReportManager",
+    "lib.report.csv_report.CSVReport",
+    "lib.report.html_report.HTMLReport",
+    "lib.report.json_report.JSONReport",
+    "lib.report.markdown_report.MarkdownReport",
+    "lib.report.plain_text_report.PlainTextReport",
+    "lib.report.simple_report.SimpleReport",
+    "lib.report.xml_report.XMLReport",
+    "lib.report.sqlite_report.SQLiteReport",
     "urllib3.util.retry.Retry",
 )
 
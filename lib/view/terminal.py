@@ -19,9 +19,11 @@
 import sys
 import shutil
 
+from time import time as current_time
+
 from lib.core.data import options
 from lib.core.decorators import locked
-from lib.core.settings import IS_WINDOWS
+from lib.core.settings import IS_WINDOWS, RATE_UPDATE_DELAY
 from lib.view.colors import set_color, clean_color, disable_color
 
 if IS_WINDOWS:
@@ -35,6 +37,8 @@ if IS_WINDOWS:
 class CLI:
     def __init__(self):
         self.last_in_line = False
+        self.last_path_update = 0
+        self.last_path_job = 0
         self.buffer = ""
 
         if not options["color"]:
@@ -113,6 +117,20 @@ class CLI:
         self.new_line(message)
 
     def last_path(self, index, length, current_job, all_jobs, rate, errors):
+        # This is called for every non-found response, redraw the progress bar
+        # only as often as the request rate it shows gets updated, but always
+        # draw the end of a job and the start of the next one
+        now = current_time()
+        if (
+            index < length
+            and current_job == self.last_path_job
+            and now - self.last_path_update < RATE_UPDATE_DELAY
+        ):
+            return
+
+        self.last_path_update = now
+        self.last_path_job = current_job
+
         percentage = int(index / length * 100)
         task = set_color("#", fore="cyan", style="bright") * int(percentage / 5)
         task += " " * (20 - int(percentage / 5))
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+#  Author: Mauro Soria
+
+import pickle
+from unittest import TestCase
+from unittest.mock import patch
+
+from lib.core.data import options
+from lib.core.dictionary import Dictionary
+
+WORDLIST = "./tests/static/wordlist.txt"
+PATHS = ["index.php", "index.asp", "home.html"]
+
+
+@patch.dict(options, extensions=("php", "asp"))
+class TestDictionary(TestCase):
+    def test_iteration(self):
+        dictionary = Dictionary(files=[WORDLIST])
+        self.assertEqual(len(dictionary), len(PATHS), "Wrong dictionary length")
+        self.assertEqual(list(dictionary), PATHS, "Paths are not in the wordlist order")
+
+    def test_next(self):
+        dictionary = Dictionary(files=[WORDLIST])
+        self.assertEqual([next(dictionary) for _ in PATHS], PATHS)
+        self.assertEqual(dictionary.index, len(PATHS))
+        self.assertRaises(StopIteration, next, dictionary)
+
+        dictionary.reset()
+        self.assertEqual(next(dictionary), PATHS[0], "Dictionary is not reset")
+
+    def test_empty(self):
+        dictionary = Dictionary(files=[])
+        self.assertEqual(len(dictionary), 0)
+        self.assertEqual(list(dictionary), [])
+        self.assertRaises(StopIteration, next, dictionary)
+
+    def test_contains(self):
+        dictionary = Dictionary(files=[WORDLIST])
+        self.assertIn("index.asp", dictionary)
+        self.assertNotIn("index", dictionary)
+
+    def test_pickle(self):
+        dictionary = Dictionary(files=[WORDLIST])
+        next(dictionary)
+        restored = pickle.loads(pickle.dumps(dictionary))
+        self.assertEqual(list(restored), PATHS, "Paths are lost when pickled")
+        self.assertEqual(restored.index, 1, "Index is lost when pickled")
+        self.assertEqual(next(restored), PATHS[1])
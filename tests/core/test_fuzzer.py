@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+#  Author: Mauro Soria
+
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+
+from lib.core.data import options
+from lib.core.fuzzer import BaseFuzzer
+
+
+def is_redirect_excluded(exclude_redirect, redirect):
+    with patch.dict(options, exclude_redirect=exclude_redirect):
+        fuzzer = BaseFuzzer(
+            None, None, match_callbacks=(), not_found_callbacks=(), error_callbacks=()
+        )
+
+    response = SimpleNamespace(
+        status=301, path="admin", length=0, content="", redirect=redirect
+    )
+    return fuzzer.is_excluded(response)
+
+
+class TestFuzzer(TestCase):
+    def test_exclude_redirect_substring(self):
+        self.assertTrue(is_redirect_excluded("login.php?next=", "/login.php?next=/admin"))
+        self.assertTrue(is_redirect_excluded("a+b", "/a+b/"), "Not matched as a substring")
+        self.assertFalse(is_redirect_excluded("/login", "/admin/"))
+
+    def test_exclude_redirect_regex(self):
+        self.assertTrue(is_redirect_excluded(r"/log(in|on)\.php", "/logon.php"))
+        self.assertTrue(is_redirect_excluded("^https://", "https://example.com/"))
+        self.assertFalse(is_redirect_excluded("^https://", "/https://"))
+
+    def test_exclude_redirect_inline_flags(self):
+        self.assertTrue(is_redirect_excluded("(?i)/LOGIN", "/login"), "Inline flags are ignored")
+        self.assertFalse(is_redirect_excluded("/LOGIN", "/login"))
+
+    def test_exclude_redirect_invalid_regex(self):
+        self.assertTrue(is_redirect_excluded("*/error.html", "/foo*/error.html"))
+        self.assertFalse(is_redirect_excluded("*/error.html", "/foo/error.html"))